@@ -0,0 +1,91 @@
+# analysis_core.py
+import os
+import pandas as pd
+
+from data_validation import NETFLIX_FULL_RULES, NETFLIX_RULES, OFFICE_RULES, validate_and_quarantine
+
+NETFLIX_QUARANTINE = 'netflix_quarantine.csv'
+OFFICE_QUARANTINE = 'office_quarantine.csv'
+
+
+# =============================================================================
+# LOADING
+# Rejected rows are written to a quarantine file next to the input.
+# =============================================================================
+
+def load_netflix(path='../data/netflix_data.csv', verbose=True, rules=NETFLIX_RULES):
+    """Read and validate the Netflix CSV (pass NETFLIX_FULL_RULES to also check show_id uniqueness)."""
+    quarantine_path = os.path.join(os.path.dirname(path), NETFLIX_QUARANTINE)
+    return validate_and_quarantine(pd.read_csv(path), rules, quarantine_path, 'Netflix', verbose)
+
+
+def load_office(path='../data/office_data.csv', verbose=True):
+    """Read and validate the Office CSV."""
+    quarantine_path = os.path.join(os.path.dirname(path), OFFICE_QUARANTINE)
+    return validate_and_quarantine(pd.read_csv(path), OFFICE_RULES, quarantine_path, 'The Office', verbose)
+
+
+# =============================================================================
+# CLEANING
+# =============================================================================
+
+def netflix_movies(netflix_df):
+    """Movies with numeric `duration_min` and the first listed genre as `primary_genre`."""
+    movies = netflix_df[netflix_df['type'] == 'Movie'].copy()
+    movies['duration_min'] = movies['duration'].str.extract(r'(\d+)', expand=False).astype(float)
+    movies = movies.dropna(subset=['duration_min'])
+    movies['primary_genre'] = movies['listed_in'].str.split(',').str[0].str.strip()
+    return movies
+
+
+def office_episodes(office_df):
+    """Episodes with a 1-based `episode_number` and a `has_guest` flag."""
+    office_df = office_df.copy()
+    if 'Unnamed: 0' in office_df.columns:
+        office_df['episode_number'] = office_df['Unnamed: 0'] + 1
+    else:
+        office_df['episode_number'] = range(1, len(office_df) + 1)
+    office_df['has_guest'] = office_df['GuestStars'].notna()
+    return office_df
+
+
+# =============================================================================
+# AGGREGATES
+# =============================================================================
+
+def yearly_duration(movies, start_year=2000, min_count=5):
+    """Mean duration and movie count per release year, for years with at least `min_count` movies."""
+    if start_year is not None:
+        movies = movies[movies['release_year'] >= start_year]
+    yearly_avg = movies.groupby('release_year')['duration_min'].agg(['mean', 'count']).round(1)
+    return yearly_avg[yearly_avg['count'] >= min_count]
+
+
+def short_genres(movies, max_duration=60, n=8):
+    """The `n` most common primary genres among movies shorter than `max_duration`."""
+    return movies.loc[movies['duration_min'] < max_duration, 'primary_genre'].value_counts().head(n)
+
+
+def season_stats(episodes):
+    """Episode count, guest episodes, mean viewership / rating and best episode per season."""
+    stats = episodes.groupby('Season').agg(
+        episodes=('Viewership', 'size'),
+        with_guests=('has_guest', 'sum'),
+        mean_viewership=('Viewership', 'mean'),
+        mean_rating=('Ratings', 'mean')).round(2)
+    best = episodes.loc[episodes.groupby('Season')['Viewership'].idxmax()]
+    stats['best_episode'] = best.set_index('Season')['EpisodeTitle']
+    return stats
+
+
+def guest_impact(episodes):
+    """Episode count and mean Viewership / Ratings with and without guest stars (indexed by has_guest)."""
+    return episodes.groupby('has_guest').agg(
+        episodes=('Viewership', 'size'),
+        Viewership=('Viewership', 'mean'),
+        Ratings=('Ratings', 'mean')).round(2)
+
+
+def top_episodes(episodes, n=5):
+    """The `n` most watched episodes."""
+    return episodes.nlargest(n, 'Viewership')
@@ -0,0 +1,183 @@
+# data_validation.py
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# RULE SETS
+# Each rule names a check, the column it applies to and a reason code that
+# is written to the quarantine file for every row failing it.
+# =============================================================================
+
+NETFLIX_RATINGS = [
+    'G', 'PG', 'PG-13', 'R', 'NC-17', 'NR', 'UR',
+    'TV-Y', 'TV-Y7', 'TV-Y7-FV', 'TV-G', 'TV-PG', 'TV-14', 'TV-MA',
+]
+
+NETFLIX_RULES = [
+    {'code': 'MISSING_TITLE', 'check': 'not_null', 'column': 'title'},
+    {'code': 'INVALID_TYPE', 'check': 'allowed', 'column': 'type', 'values': ['Movie', 'TV Show']},
+    {'code': 'INVALID_RATING', 'check': 'allowed', 'column': 'rating', 'values': NETFLIX_RATINGS,
+     'allow_null': True},
+    {'code': 'INVALID_RELEASE_YEAR', 'check': 'range', 'column': 'release_year', 'min': 1900, 'max': 2100},
+    {'code': 'UNPARSEABLE_DATE_ADDED', 'check': 'date', 'column': 'date_added', 'format': '%B %d, %Y',
+     'allow_null': True},
+    {'code': 'DURATION_TYPE_MISMATCH', 'check': 'duration_type', 'column': 'duration'},
+]
+
+# Uniqueness hashes every show_id, which costs more than all the rules above
+# together on large files, so it is opt-in: the Power BI exports and the
+# report runner check it, analysis loads and sketches do not.
+NETFLIX_FULL_RULES = [
+    {'code': 'DUPLICATE_SHOW_ID', 'check': 'unique', 'column': 'show_id'},
+] + NETFLIX_RULES
+
+OFFICE_RULES = [
+    {'code': 'MISSING_TITLE', 'check': 'not_null', 'column': 'EpisodeTitle'},
+    {'code': 'INVALID_SEASON', 'check': 'range', 'column': 'Season', 'min': 1, 'max': 100},
+    {'code': 'INVALID_RATING', 'check': 'range', 'column': 'Ratings', 'min': 0, 'max': 10},
+    {'code': 'INVALID_VOTES', 'check': 'range', 'column': 'Votes', 'min': 0},
+    {'code': 'INVALID_VIEWERSHIP', 'check': 'range', 'column': 'Viewership', 'min': 0},
+    {'code': 'INVALID_DURATION', 'check': 'range', 'column': 'Duration', 'min': 1},
+    {'code': 'UNPARSEABLE_DATE', 'check': 'date', 'column': 'Date', 'format': '%d %B %Y'},
+    {'code': 'MISSING_DIRECTOR', 'check': 'not_null', 'column': 'Director'},
+    {'code': 'MISSING_WRITERS', 'check': 'not_null', 'column': 'Writers'},
+]
+
+
+# =============================================================================
+# CHECKS
+# Every check returns a boolean array that is True where the row FAILS.
+# =============================================================================
+
+def _null_allowed(df, rule):
+    if rule.get('allow_null', False):
+        return df[rule['column']].isna().to_numpy()
+    return np.zeros(len(df), dtype=bool)
+
+
+def check_not_null(df, rule):
+    return df[rule['column']].isna().to_numpy()
+
+
+def check_unique(df, rule):
+    # The first occurrence is kept, later duplicates are quarantined
+    return df[rule['column']].duplicated(keep='first').to_numpy()
+
+
+def check_allowed(df, rule):
+    # Missing values are matched in the same isin pass when they are allowed
+    allowed = list(rule['values']) + ([np.nan, None] if rule.get('allow_null', False) else [])
+    return ~df[rule['column']].isin(allowed).to_numpy()
+
+
+def check_range(df, rule):
+    # Non-numeric values become NaN and fail, which doubles as the type check
+    values = pd.to_numeric(df[rule['column']], errors='coerce').to_numpy(dtype=float)
+    ok = ~np.isnan(values)
+    if 'min' in rule:
+        ok &= values >= rule['min']
+    if 'max' in rule:
+        ok &= values <= rule['max']
+    return ~(ok | _null_allowed(df, rule))
+
+
+def _failing_values(series, check):
+    """
+    Rows whose value fails a string check. The check only runs on the
+    distinct values of a low-cardinality column, and rows are matched
+    against the (usually few or no) failing values with `isin`. Missing
+    values never fail here.
+    """
+    uniques = pd.Series(series.unique(), dtype=object).dropna()
+    return series.isin(uniques[~check(uniques).to_numpy(dtype=bool)]).to_numpy()
+
+
+def check_date(df, rule):
+    failed = _failing_values(df[rule['column']], lambda values: pd.to_datetime(
+        values.str.strip(), format=rule['format'], errors='coerce').notna())
+    if not rule.get('allow_null', False):
+        failed = failed | df[rule['column']].isna().to_numpy()
+    return failed
+
+
+def check_duration_type(df, rule):
+    # Movies are "N min", TV shows are "N Season(s)"; other types are left to INVALID_TYPE.
+    # Both columns are mapped to a kind (1 movie / minutes, 2 show / seasons, 0 other or
+    # missing), classifying only the distinct durations.
+    durations = df[rule['column']]
+    uniques = pd.Series(durations.unique(), dtype=object).dropna()
+    kinds = np.where(uniques.str.match(r'\d+ min$', na=False), 1,
+                     np.where(uniques.str.match(r'\d+ Seasons?$', na=False), 2, 0))
+    duration_kind = durations.map(pd.Series(kinds, index=uniques.to_numpy())).fillna(0).to_numpy()
+    type_kind = df['type'].map({'Movie': 1, 'TV Show': 2}).fillna(0).to_numpy()
+    return (type_kind > 0) & (type_kind != duration_kind)
+
+
+CHECKS = {
+    'not_null': check_not_null,
+    'unique': check_unique,
+    'allowed': check_allowed,
+    'range': check_range,
+    'date': check_date,
+    'duration_type': check_duration_type,
+}
+
+
+# =============================================================================
+# VALIDATION STAGE
+# =============================================================================
+
+def validate(df, rules):
+    """
+    Evaluate all rules as boolean masks in one pass over the frame.
+
+    Returns (valid_df, quarantine_df, summary): quarantine_df holds the
+    failing rows with a ';'-joined `reason_codes` column, summary counts
+    failures per rule.
+    """
+    # One row per rule, so the reductions below run over contiguous rows
+    failures = np.vstack([CHECKS[rule['check']](df, rule) for rule in rules]) \
+        if rules else np.zeros((0, len(df)), dtype=bool)
+    bad_rows = failures.any(axis=0)
+
+    quarantine_df = df[bad_rows].copy()
+    codes = np.array([rule['code'] for rule in rules], dtype=object)
+    quarantine_df['reason_codes'] = [';'.join(codes[row]) for row in failures[:, bad_rows].T]
+
+    failed_counts = np.count_nonzero(failures, axis=1)
+    summary = pd.DataFrame({
+        'code': codes,
+        'column': [rule['column'] for rule in rules],
+        'failed': failed_counts,
+        'failed_pct': (failed_counts / max(len(df), 1) * 100).round(3),
+    })
+    valid_df = df[~bad_rows] if bad_rows.any() else df
+    return valid_df, quarantine_df, summary
+
+
+def validate_and_quarantine(df, rules, quarantine_path, name='data', verbose=True):
+    """Run `validate`, write the quarantined rows to CSV and print a summary."""
+    valid_df, quarantine_df, summary = validate(df, rules)
+    quarantine_df.to_csv(quarantine_path, index=False)
+
+    if verbose:
+        print(f"🔎 Validated {name}: {len(valid_df):,} rows passed, {len(quarantine_df):,} quarantined")
+        for _, rule in summary[summary['failed'] > 0].iterrows():
+            print(f"  - {rule['code']} ({rule['column']}): {rule['failed']:,} rows")
+        if len(quarantine_df) > 0:
+            print(f"  Quarantined rows written to {quarantine_path}")
+
+    return valid_df
+
+
+if __name__ == '__main__':
+    print("🔎 DATA VALIDATION")
+    print("=" * 50)
+
+    netflix_df = pd.read_csv('../data/netflix_data.csv')
+    validate_and_quarantine(netflix_df, NETFLIX_FULL_RULES, '../data/netflix_quarantine.csv', 'Netflix')
+
+    office_df = pd.read_csv('../data/office_data.csv')
+    validate_and_quarantine(office_df, OFFICE_RULES, '../data/office_quarantine.csv', 'The Office')
+
+    print("\n✅ Validation complete!")
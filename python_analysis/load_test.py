@@ -0,0 +1,63 @@
+# load_test.py
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen
+
+import numpy as np
+
+# Mix of queries sent to query_api.py
+QUERIES = [
+    '/netflix/duration-trend',
+    '/netflix/duration-trend?start_year=2010&end_year=2020',
+    '/netflix/duration-trend?genre=documentaries',
+    '/netflix/short-genres',
+    '/netflix/short-genres?start_year=2015',
+    '/office/top-episodes?n=10',
+    '/office/top-episodes?season=5',
+    '/office/guest-impact',
+    '/office/guest-impact?season=3',
+    '/office/seasons',
+]
+
+
+def timed_request(url):
+    started = time.perf_counter()
+    with urlopen(url) as response:
+        response.read()
+    return time.perf_counter() - started
+
+
+def run_load_test(base_url, n_requests=2000, concurrency=16, seed=42):
+    """Send `n_requests` random queries with `concurrency` threads and summarize latency."""
+    rng = random.Random(seed)
+    urls = [base_url + rng.choice(QUERIES) for _ in range(n_requests)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = np.array(list(executor.map(timed_request, urls)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'requests': n_requests,
+        'p50_ms': np.percentile(latencies, 50) * 1000,
+        'p99_ms': np.percentile(latencies, 99) * 1000,
+        'rps': n_requests / elapsed,
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load test for query_api.py')
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args()
+
+    print("⏱️ QUERY API LOAD TEST")
+    print("=" * 50)
+    result = run_load_test(args.url.rstrip('/'), args.requests, args.concurrency)
+    print(f"✓ Requests: {result['requests']:,} ({args.concurrency} concurrent)")
+    print(f"  p50 latency: {result['p50_ms']:.2f} ms")
+    print(f"  p99 latency: {result['p99_ms']:.2f} ms")
+    print(f"  Throughput:  {result['rps']:.0f} requests/sec")
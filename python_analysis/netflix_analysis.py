@@ -3,6 +3,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib.patches as patches
+from analysis_core import load_netflix, netflix_movies, yearly_duration, short_genres
 
 print("🎬 NETFLIX MOVIES ANALYSIS - WITH MOVIE NAMES")
 print("=" * 60)
@@ -18,16 +19,14 @@ print("✓ Initial data dictionary created")
 
 # Step 2: Load and process the full dataset
 print(f"\n📁 Step 2: Loading and processing Netflix dataset...")
-netflix_df = pd.read_csv('../data/netflix_data.csv')
-netflix_movies = netflix_df[netflix_df['type'] == 'Movie'].copy()
+netflix_df = load_netflix('../data/netflix_data.csv')
 
-# Extract numeric duration and clean data
-netflix_movies['duration_min'] = netflix_movies['duration'].str.extract('(\d+)').astype(float)
-netflix_movies = netflix_movies.dropna(subset=['duration_min'])
+# Keep movies with a numeric duration
+movies_df = netflix_movies(netflix_df)
 
 # Create subset with relevant columns
-movie_columns = ['title', 'country', 'listed_in', 'release_year', 'duration_min']
-netflix_movies_subset = netflix_movies[movie_columns].copy()
+movie_columns = ['title', 'country', 'listed_in', 'primary_genre', 'release_year', 'duration_min']
+netflix_movies_subset = movies_df[movie_columns].copy()
 
 print(f"✓ {len(netflix_movies_subset)} movies processed")
 
@@ -48,14 +47,11 @@ def assign_color(genre_string):
 netflix_movies_subset['color'] = netflix_movies_subset['listed_in'].apply(assign_color)
 
 # Step 4: Prepare trend analysis data
-modern_movies = netflix_movies_subset[netflix_movies_subset['release_year'] >= 2000]
-yearly_avg = modern_movies.groupby('release_year')['duration_min'].agg(['mean', 'count']).round(1)
-yearly_avg = yearly_avg[yearly_avg['count'] >= 5]
+yearly_avg = yearly_duration(netflix_movies_subset, start_year=2000, min_count=5)
 
 # Step 5: Short movies analysis
 short_movies = netflix_movies_subset[netflix_movies_subset['duration_min'] < 60]
-short_movies['primary_genre'] = short_movies['listed_in'].str.split(',').str[0].str.strip()
-genre_counts = short_movies['primary_genre'].value_counts().head(8)
+genre_counts = short_genres(netflix_movies_subset, max_duration=60, n=8)
 
 # Step 6: Find notable movies for annotation
 # Longest and shortest movies
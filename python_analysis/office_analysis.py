@@ -4,29 +4,27 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.lines import Line2D
 import matplotlib.patches as patches
+from analysis_core import load_office, office_episodes, season_stats, guest_impact, top_episodes
 
 print("🏢 THE OFFICE ANALYSIS - WITH EPISODE NAMES")
 print("=" * 55)
 
 # Step 1: Load and prepare data
 print("\n📁 Step 1: Loading and preparing The Office dataset...")
-office_df = pd.read_csv('../data/office_data.csv')
+office_df = load_office('../data/office_data.csv')
 
-# Create episode number column
-if 'Unnamed: 0' in office_df.columns:
-    office_df['episode_number'] = office_df['Unnamed: 0'] + 1
-else:
-    office_df['episode_number'] = range(1, len(office_df) + 1)
-
-# Set up guest stars analysis
+# Add episode number and guest stars flag
+office_df = office_episodes(office_df)
 guest_col = 'GuestStars'
 has_guest_col = 'has_guest'
-office_df[has_guest_col] = office_df[guest_col].notna()
 
 # Scale ratings for color coding
 min_rating = office_df['Ratings'].min()
 max_rating = office_df['Ratings'].max()
-office_df['scaled_rating'] = (office_df['Ratings'] - min_rating) / (max_rating - min_rating)
+if max_rating > min_rating:
+    office_df['scaled_rating'] = (office_df['Ratings'] - min_rating) / (max_rating - min_rating)
+else:
+    office_df['scaled_rating'] = 0.0
 
 # Define color and size mapping functions
 def get_rating_color(scaled_rating):
@@ -54,7 +52,7 @@ most_watched = office_df.loc[office_df['Viewership'].idxmax()]
 highest_rated = office_df.loc[office_df['Ratings'].idxmax()]
 guest_episodes = office_df[office_df[has_guest_col] == True]
 most_watched_guest = guest_episodes.loc[guest_episodes['Viewership'].idxmax()] if len(guest_episodes) > 0 else None
-top_5_episodes = office_df.nlargest(5, 'Viewership')
+top_5_episodes = top_episodes(office_df, 5)
 
 # =============================================================================
 # CREATE COMBINED FIGURE WITH EPISODE NAMES
@@ -110,12 +108,7 @@ ax1.grid(True, alpha=0.3)
 
 # Plot 2: Viewership by Season with Notable Episodes (Middle Left)
 ax2 = plt.subplot(3, 2, 3)
-season_stats = office_df.groupby('Season').agg({
-    'Viewership': ['mean', 'max'],
-    'EpisodeTitle': 'first'
-}).round(2)
-
-season_viewership = season_stats[('Viewership', 'mean')]
+season_viewership = season_stats(office_df)['mean_viewership']
 season_colors = plt.cm.viridis(np.linspace(0, 1, len(season_viewership)))
 
 bars2 = ax2.bar(season_viewership.index, season_viewership.values, 
@@ -134,10 +127,7 @@ for bar in bars2:
 
 # Plot 3: Guest Stars Impact with Examples (Middle Right)
 ax3 = plt.subplot(3, 2, 4)
-guest_stats = office_df.groupby(has_guest_col).agg({
-    'Viewership': 'mean',
-    'Ratings': 'mean'
-}).round(2)
+guest_stats = guest_impact(office_df)
 
 categories = ['No Guests', 'With Guests']
 viewership_means = [guest_stats.loc[False, 'Viewership'], guest_stats.loc[True, 'Viewership']]
@@ -173,7 +163,7 @@ for i, (bar1, bar2) in enumerate(zip(bars3_1, bars3_2)):
 
 # Plot 4: Top Episodes with Names (Bottom Left)
 ax4 = plt.subplot(3, 2, 5)
-top_episodes_plot = office_df.nlargest(8, 'Viewership')
+top_episodes_plot = top_episodes(office_df, 8)
 
 # Create horizontal bar chart for better name visibility
 y_pos = np.arange(len(top_episodes_plot))
@@ -271,7 +261,7 @@ if len(guest_episodes) > 0:
 
 # Top 5 episodes with names
 print(f"\n🏆 Top 5 Most Watched Episodes:")
-top_5 = office_df.nlargest(5, 'Viewership')
+top_5 = top_episodes(office_df, 5)
 for i, (_, ep) in enumerate(top_5.iterrows(), 1):
     guest_status = "👥 With guests" if ep[has_guest_col] else "👤 No guests"
     guest_info = f" ({str(ep[guest_col]).split(',')[0].strip()})" if ep[has_guest_col] and pd.notna(ep[guest_col]) else ""
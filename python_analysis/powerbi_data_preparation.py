@@ -1,21 +1,22 @@
 # powerbi_data_preparation.py
+import os
+import tempfile
 import pandas as pd
 import numpy as np
 
-print("📊 PREPARING DATA FOR POWER BI & TABLEAU")
-print("=" * 50)
+from analysis_core import load_netflix, load_office, netflix_movies, office_episodes
+from data_validation import NETFLIX_FULL_RULES
 
-# Load Netflix data
-netflix_df = pd.read_csv('../data/netflix_data.csv')
-netflix_movies = netflix_df[netflix_df['type'] == 'Movie'].copy()
+NETFLIX_INPUT = '../data/netflix_data.csv'
+OFFICE_INPUT = '../data/office_data.csv'
+NETFLIX_OUTPUT = '../data/netflix_powerbi.csv'
+OFFICE_OUTPUT = '../data/office_powerbi.csv'
 
-# Clean and prepare Netflix data
-netflix_movies['duration_min'] = netflix_movies['duration'].str.extract('(\d+)').astype(float)
-netflix_movies = netflix_movies.dropna(subset=['duration_min'])
+# Read once at import: os.umask can only be queried by setting it, which
+# is not safe once exports run concurrently in threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
-# Add derived columns for better BI visualization
-netflix_movies['is_short_movie'] = netflix_movies['duration_min'] < 60
-netflix_movies['decade'] = (netflix_movies['release_year'] // 10) * 10
 
 # Categorize genres
 def categorize_genre(genre_string):
@@ -35,59 +36,118 @@ def categorize_genre(genre_string):
     else:
         return 'Other'
 
-netflix_movies['genre_category'] = netflix_movies['listed_in'].apply(categorize_genre)
-
-# Duration categories
-netflix_movies['duration_category'] = netflix_movies['duration_min'].apply(lambda x:
-    'Very Short (< 60)' if x < 60 else
-    'Short (60-90)' if x < 90 else
-    'Medium (90-120)' if x < 120 else
-    'Long (120+)')
-
-# Save for Power BI/Tableau
-netflix_powerbi = netflix_movies[[
-    'title', 'release_year', 'duration_min', 'genre_category', 
-    'is_short_movie', 'decade', 'duration_category', 'country', 'rating'
-]].copy()
-
-netflix_powerbi.to_csv('../data/netflix_powerbi.csv', index=False)
-print(f"✓ Netflix data prepared: {len(netflix_powerbi)} movies")
-
-# Load and prepare Office data
-office_df = pd.read_csv('../data/office_data.csv')
-
-if 'Unnamed: 0' in office_df.columns:
-    office_df['episode_number'] = office_df['Unnamed: 0'] + 1
-else:
-    office_df['episode_number'] = range(1, len(office_df) + 1)
-
-# Prepare Office data for BI
-office_df['has_guest_stars'] = office_df['GuestStars'].notna()
-office_df['scaled_rating'] = (office_df['Ratings'] - office_df['Ratings'].min()) / (office_df['Ratings'].max() - office_df['Ratings'].min())
-
-# Rating categories
-office_df['rating_category'] = office_df['scaled_rating'].apply(lambda x:
-    'Low' if x < 0.25 else
-    'Medium-Low' if x < 0.50 else
-    'Medium-High' if x < 0.75 else
-    'High')
-
-# Viewership categories  
-office_df['viewership_category'] = office_df['Viewership'].apply(lambda x:
-    'Low (< 5M)' if x < 5 else
-    'Medium (5-8M)' if x < 8 else
-    'High (8M+)')
-
-office_powerbi = office_df[[
-    'episode_number', 'Season', 'EpisodeTitle', 'Ratings', 'Viewership',
-    'has_guest_stars', 'rating_category', 'viewership_category', 'GuestStars'
-]].copy()
-
-office_powerbi.to_csv('../data/office_powerbi.csv', index=False)
-print(f"✓ Office data prepared: {len(office_powerbi)} episodes")
-
-print("\n✅ Data preparation complete!")
-print("Files created:")
-print("  - ../data/netflix_powerbi.csv")
-print("  - ../data/office_powerbi.csv")
-print("\n🚀 Ready for Power BI and Tableau!")
\ No newline at end of file
+
+def prepare_netflix(movies):
+    """
+    Build the Netflix movies table used by Power BI/Tableau from the
+    cleaned movies of `analysis_core.netflix_movies`.
+    """
+    netflix_movies = movies.copy()
+
+    # Add derived columns for better BI visualization
+    netflix_movies['is_short_movie'] = netflix_movies['duration_min'] < 60
+    netflix_movies['decade'] = (netflix_movies['release_year'] // 10) * 10
+
+    netflix_movies['genre_category'] = netflix_movies['listed_in'].apply(categorize_genre)
+
+    # Duration categories
+    netflix_movies['duration_category'] = netflix_movies['duration_min'].apply(lambda x:
+        'Very Short (< 60)' if x < 60 else
+        'Short (60-90)' if x < 90 else
+        'Medium (90-120)' if x < 120 else
+        'Long (120+)')
+
+    return netflix_movies[[
+        'title', 'release_year', 'duration_min', 'genre_category', 
+        'is_short_movie', 'decade', 'duration_category', 'country', 'rating'
+    ]].copy()
+
+
+def prepare_office(episodes):
+    """
+    Build the Office episodes table used by Power BI/Tableau from the
+    episodes of `analysis_core.office_episodes`.
+    """
+    office_df = episodes.copy()
+
+    # Prepare Office data for BI
+    office_df['has_guest_stars'] = office_df['has_guest']
+    rating_range = office_df['Ratings'].max() - office_df['Ratings'].min()
+    if rating_range > 0:
+        office_df['scaled_rating'] = (office_df['Ratings'] - office_df['Ratings'].min()) / rating_range
+    else:
+        office_df['scaled_rating'] = 0.0
+
+    # Rating categories
+    office_df['rating_category'] = office_df['scaled_rating'].apply(lambda x:
+        'Low' if x < 0.25 else
+        'Medium-Low' if x < 0.50 else
+        'Medium-High' if x < 0.75 else
+        'High')
+
+    # Viewership categories  
+    office_df['viewership_category'] = office_df['Viewership'].apply(lambda x:
+        'Low (< 5M)' if x < 5 else
+        'Medium (5-8M)' if x < 8 else
+        'High (8M+)')
+
+    return office_df[[
+        'episode_number', 'Season', 'EpisodeTitle', 'Ratings', 'Viewership',
+        'has_guest_stars', 'rating_category', 'viewership_category', 'GuestStars'
+    ]].copy()
+
+
+def write_csv_atomic(df, path):
+    """
+    Write a CSV next to its destination and rename it into place, so
+    readers such as Power BI never see a half-written file. The file is
+    UTF-8 and keeps the destination's permissions (or the umask default),
+    like a plain to_csv(path) would.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            df.to_csv(f, index=False)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def export_netflix(input_path=NETFLIX_INPUT, output_path=NETFLIX_OUTPUT, verbose=False):
+    """
+    Load, validate, prepare and atomically write the Netflix export. Returns
+    row count. The validation summary is only printed when `verbose` (the
+    refresh service runs exports in worker threads and logs instead).
+    """
+    netflix_powerbi = prepare_netflix(netflix_movies(load_netflix(input_path, verbose, NETFLIX_FULL_RULES)))
+    write_csv_atomic(netflix_powerbi, output_path)
+    return len(netflix_powerbi)
+
+
+def export_office(input_path=OFFICE_INPUT, output_path=OFFICE_OUTPUT, verbose=False):
+    """Load, validate, prepare and atomically write the Office export. Returns row count."""
+    office_powerbi = prepare_office(office_episodes(load_office(input_path, verbose)))
+    write_csv_atomic(office_powerbi, output_path)
+    return len(office_powerbi)
+
+
+if __name__ == '__main__':
+    print("📊 PREPARING DATA FOR POWER BI & TABLEAU")
+    print("=" * 50)
+
+    # Save for Power BI/Tableau
+    print(f"✓ Netflix data prepared: {export_netflix(verbose=True)} movies")
+    print(f"✓ Office data prepared: {export_office(verbose=True)} episodes")
+
+    print("\n✅ Data preparation complete!")
+    print("Files created:")
+    print("  - ../data/netflix_powerbi.csv")
+    print("  - ../data/office_powerbi.csv")
+    print("\n🚀 Ready for Power BI and Tableau!")
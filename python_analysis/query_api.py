@@ -0,0 +1,223 @@
+# query_api.py
+import inspect
+import json
+import sys
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+
+import analysis_core
+
+CACHE_SIZE = 1024
+
+
+# =============================================================================
+# DATA LOADING (once at startup)
+# =============================================================================
+
+def load_netflix_movies(path='../data/netflix_data.csv'):
+    """Validated Netflix movies with numeric duration and primary genre."""
+    movies = analysis_core.netflix_movies(analysis_core.load_netflix(path))
+    return movies[['title', 'listed_in', 'primary_genre', 'release_year', 'duration_min']]
+
+
+def load_office_episodes(path='../data/office_data.csv'):
+    """Validated Office episodes with episode number and guest flag."""
+    return analysis_core.office_episodes(analysis_core.load_office(path))
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+class BadRequest(ValueError):
+    pass
+
+
+def _int_param(params, name, default=None, minimum=None):
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise BadRequest(f"'{name}' must be an integer")
+    if minimum is not None and value < minimum:
+        raise BadRequest(f"'{name}' must be at least {minimum}")
+    return value
+
+
+def _count_param(params, name):
+    # Result sizes such as n: negative values would slice from the end
+    return _int_param(params, name, minimum=1)
+
+
+def _non_negative_param(params, name):
+    return _int_param(params, name, minimum=0)
+
+
+def _str_param(params, name):
+    values = params.get(name)
+    return values[0].strip().lower() if values and values[0].strip() else None
+
+
+def _filter_movies(movies, start_year, end_year, genre):
+    mask = pd.Series(True, index=movies.index)
+    if start_year is not None:
+        mask &= movies['release_year'] >= start_year
+    if end_year is not None:
+        mask &= movies['release_year'] <= end_year
+    if genre is not None:
+        # Whole genre names only: 'drama' must not match 'Dramas'
+        genres = movies['listed_in'].str.lower().str.split(',').explode().str.strip()
+        mask &= genres.eq(genre).groupby(level=0).any()
+    return movies[mask]
+
+
+def _filter_season(episodes, season):
+    return episodes if season is None else episodes[episodes['Season'] == season]
+
+
+def duration_trend(data, start_year=2000, end_year=None, genre=None, min_count=5):
+    movies = _filter_movies(data['netflix'], None, end_year, genre)
+    yearly = analysis_core.yearly_duration(movies, start_year, min_count)
+    return [{'year': int(year), 'mean_duration': row['mean'], 'count': int(row['count'])}
+            for year, row in yearly.iterrows()]
+
+
+def short_movie_genres(data, start_year=None, end_year=None, genre=None, max_duration=60, n=8):
+    movies = _filter_movies(data['netflix'], start_year, end_year, genre)
+    counts = analysis_core.short_genres(movies, max_duration, n)
+    return [{'genre': name, 'count': int(count)} for name, count in counts.items()]
+
+
+def top_episodes(data, season=None, n=5):
+    episodes = analysis_core.top_episodes(_filter_season(data['office'], season), n)
+    return [{
+        'episode_number': int(ep['episode_number']),
+        'season': int(ep['Season']),
+        'title': ep['EpisodeTitle'],
+        'viewership': float(ep['Viewership']),
+        'rating': float(ep['Ratings']),
+        'guest_stars': ep['GuestStars'] if pd.notna(ep['GuestStars']) else None,
+    } for _, ep in episodes.iterrows()]
+
+
+def guest_impact(data, season=None):
+    stats = analysis_core.guest_impact(_filter_season(data['office'], season))
+    return {('with_guests' if has_guest else 'no_guests'): {
+        'episodes': int(row['episodes']),
+        'mean_viewership': row['Viewership'],
+        'mean_rating': row['Ratings'],
+    } for has_guest, row in stats.iterrows()}
+
+
+def season_stats(data, season=None):
+    stats = analysis_core.season_stats(_filter_season(data['office'], season))
+    return [{
+        'season': int(season_number),
+        'episodes': int(row['episodes']),
+        'with_guests': int(row['with_guests']),
+        'mean_viewership': row['mean_viewership'],
+        'mean_rating': row['mean_rating'],
+        'best_episode': row['best_episode'],
+    } for season_number, row in stats.iterrows()]
+
+
+# path -> (query function, {parameter: parser})
+ENDPOINTS = {
+    '/netflix/duration-trend': (duration_trend, {
+        'start_year': _int_param, 'end_year': _int_param, 'genre': _str_param, 'min_count': _non_negative_param}),
+    '/netflix/short-genres': (short_movie_genres, {
+        'start_year': _int_param, 'end_year': _int_param, 'genre': _str_param,
+        'max_duration': _int_param, 'n': _count_param}),
+    '/office/top-episodes': (top_episodes, {'season': _int_param, 'n': _count_param}),
+    '/office/guest-impact': (guest_impact, {'season': _int_param}),
+    '/office/seasons': (season_stats, {'season': _int_param}),
+}
+
+
+@lru_cache(maxsize=None)
+def _defaults(query_function):
+    return {name: parameter.default for name, parameter in inspect.signature(query_function).parameters.items()
+            if parameter.default is not inspect.Parameter.empty}
+
+
+def normalize_params(path, query):
+    """
+    Parse the query string for an endpoint into a sorted tuple of typed
+    values, with the query function's defaults filled in, so equivalent
+    requests share a cache entry. Unknown and empty parameters are dropped.
+    """
+    query_function, parsers = ENDPOINTS[path]
+    params = parse_qs(query)
+    defaults = _defaults(query_function)
+    normalized = {}
+    for name, parser in parsers.items():
+        value = parser(params, name)
+        if value is None:
+            value = defaults.get(name)
+        if value is not None:
+            normalized[name] = value
+    return tuple(sorted(normalized.items()))
+
+
+def make_app(data):
+    """Return a cached `handle(path, query) -> (status, body bytes)` for the loaded frames."""
+
+    @lru_cache(maxsize=CACHE_SIZE)
+    def cached_query(path, params):
+        query_function, _ = ENDPOINTS[path]
+        return json.dumps(query_function(data, **dict(params))).encode('utf-8')
+
+    def handle(path, query):
+        if path not in ENDPOINTS:
+            return 404, json.dumps({'error': 'unknown endpoint', 'endpoints': sorted(ENDPOINTS)}).encode('utf-8')
+        try:
+            params = normalize_params(path, query)
+        except BadRequest as e:
+            return 400, json.dumps({'error': str(e)}).encode('utf-8')
+        return 200, cached_query(path, params)
+
+    handle.cache_info = cached_query.cache_info
+    return handle
+
+
+def make_handler(app):
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            status, body = app(url.path.rstrip('/') or '/', url.query)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # keep the console quiet under load
+
+    return QueryHandler
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+
+    print("🌐 NETFLIX & OFFICE QUERY API")
+    print("=" * 50)
+
+    data = {'netflix': load_netflix_movies(), 'office': load_office_episodes()}
+    print(f"✓ {len(data['netflix'])} movies and {len(data['office'])} episodes loaded")
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(make_app(data)))
+    print(f"✓ Serving on http://127.0.0.1:{port}")
+    for path in ENDPOINTS:
+        print(f"  - {path}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n✅ Query API stopped")
+        server.server_close()
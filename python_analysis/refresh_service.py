@@ -0,0 +1,116 @@
+# refresh_service.py
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from powerbi_data_preparation import (
+    NETFLIX_INPUT, OFFICE_INPUT, NETFLIX_OUTPUT, OFFICE_OUTPUT,
+    export_netflix, export_office,
+)
+
+logger = logging.getLogger('refresh_service')
+
+
+def default_exports(data_dir='../data'):
+    """Map each watched input file to the export it feeds."""
+    return {
+        os.path.join(data_dir, os.path.basename(NETFLIX_INPUT)):
+            ('netflix', export_netflix, os.path.join(data_dir, os.path.basename(NETFLIX_OUTPUT))),
+        os.path.join(data_dir, os.path.basename(OFFICE_INPUT)):
+            ('office', export_office, os.path.join(data_dir, os.path.basename(OFFICE_OUTPUT))),
+    }
+
+
+def file_signature(path):
+    """(mtime, size) of a file, or None when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class RefreshService:
+    """
+    Polls the input CSVs and rebuilds the matching Power BI export after
+    writes have settled for `debounce` seconds. Exports that become due
+    in the same cycle run concurrently in a thread pool.
+    """
+
+    def __init__(self, exports=None, poll_interval=1.0, debounce=2.0, max_workers=2):
+        self.exports = exports if exports is not None else default_exports()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.signatures = {path: file_signature(path) for path in self.exports}
+        self.pending = {}  # input path -> time of last observed change
+
+    def poll(self, now=None):
+        """Record changed inputs and return those whose debounce has expired."""
+        now = time.monotonic() if now is None else now
+        for path in self.exports:
+            signature = file_signature(path)
+            if signature != self.signatures[path]:
+                self.signatures[path] = signature
+                if signature is not None:
+                    self.pending[path] = now
+
+        due = [path for path, changed in self.pending.items() if now - changed >= self.debounce]
+        for path in due:
+            del self.pending[path]
+        return due
+
+    async def refresh(self, paths):
+        """Rebuild the exports for the given inputs concurrently."""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        names, tasks = [], []
+        for path in paths:
+            name, export, output = self.exports[path]
+            names.append(name)
+            tasks.append(loop.run_in_executor(self.executor, export, path, output))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error("%s export failed: %s", name, result)
+            else:
+                logger.info("%s export rebuilt: %d rows", name, result)
+        logger.info("refresh of %s took %.3fs", ', '.join(names), time.perf_counter() - started)
+        return dict(zip(names, results))
+
+    async def run_once(self):
+        """One poll cycle. Returns the refresh results, or None if nothing was due."""
+        due = self.poll()
+        if not due:
+            return None
+        return await self.refresh(due)
+
+    async def run(self, stop_event=None):
+        """Poll until `stop_event` is set (forever when it is None)."""
+        stop_event = stop_event or asyncio.Event()
+        logger.info("watching %s", ', '.join(self.exports))
+        try:
+            while not stop_event.is_set():
+                await self.run_once()
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.executor.shutdown(wait=True)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    print("🔄 POWER BI REFRESH SERVICE")
+    print("=" * 50)
+    print("Watching ../data for new netflix_data.csv / office_data.csv (Ctrl+C to stop)")
+
+    try:
+        asyncio.run(RefreshService().run())
+    except KeyboardInterrupt:
+        print("\n✅ Refresh service stopped")
@@ -0,0 +1,208 @@
+# report_runner.py
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import pandas as pd
+
+from analysis_core import (
+    NETFLIX_QUARANTINE, OFFICE_QUARANTINE, netflix_movies, office_episodes, yearly_duration, short_genres, season_stats, guest_impact, top_episodes,
+)
+from data_validation import NETFLIX_FULL_RULES, OFFICE_RULES, validate_and_quarantine
+from powerbi_data_preparation import (
+    NETFLIX_INPUT, OFFICE_INPUT, NETFLIX_OUTPUT, OFFICE_OUTPUT,
+    prepare_netflix, prepare_office, write_csv_atomic,
+)
+
+
+# =============================================================================
+# STAGES
+# Each stage is a function of its dependencies' results, in order. The
+# cleaning and aggregate stages are the analysis_core functions shared with
+# the standalone scripts and the query API.
+# =============================================================================
+
+def netflix_summary(netflix_df):
+    """The facts examine_data.py prints about the Netflix file."""
+    return {
+        'shape': netflix_df.shape,
+        'types': netflix_df['type'].value_counts(),
+        'year_range': (netflix_df['release_year'].min(), netflix_df['release_year'].max()),
+        'top_genres': netflix_df['listed_in'].str.split(', ').explode().value_counts().head(),
+    }
+
+
+def office_summary(office_df):
+    """The facts examine_data.py prints about the Office file."""
+    return {
+        'shape': office_df.shape,
+        'episodes_per_season': office_df['Season'].value_counts().sort_index(),
+        'rating_range': (office_df['Ratings'].min(), office_df['Ratings'].max()),
+        'guest_episodes': int(office_df['GuestStars'].notna().sum()),
+        'viewership_mean': office_df['Viewership'].mean(),
+    }
+
+
+def build_stages(data_dir='../data'):
+    """name -> (function, dependency names). Paths are resolved against `data_dir`."""
+    path = lambda name: os.path.join(data_dir, os.path.basename(name))
+
+    def export(prepare, output):
+        def run(cleaned_df):
+            exported = prepare(cleaned_df)
+            write_csv_atomic(exported, path(output))
+            return len(exported)
+        return run
+
+    return {
+        'netflix_raw': (lambda: pd.read_csv(path(NETFLIX_INPUT)), []),
+        'office_raw': (lambda: pd.read_csv(path(OFFICE_INPUT)), []),
+        'netflix_valid': (lambda df: validate_and_quarantine(
+            df, NETFLIX_FULL_RULES, path(NETFLIX_QUARANTINE), 'Netflix', verbose=False), ['netflix_raw']),
+        'office_valid': (lambda df: validate_and_quarantine(
+            df, OFFICE_RULES, path(OFFICE_QUARANTINE), 'The Office', verbose=False), ['office_raw']),
+        'netflix_movies': (netflix_movies, ['netflix_valid']),
+        'office_episodes': (office_episodes, ['office_valid']),
+        'netflix_summary': (netflix_summary, ['netflix_raw']),
+        'office_summary': (office_summary, ['office_raw']),
+        'yearly_duration': (yearly_duration, ['netflix_movies']),
+        'short_genres': (short_genres, ['netflix_movies']),
+        'season_stats': (season_stats, ['office_episodes']),
+        'guest_impact': (guest_impact, ['office_episodes']),
+        'top_episodes': (top_episodes, ['office_episodes']),
+        'netflix_export': (export(prepare_netflix, NETFLIX_OUTPUT), ['netflix_movies']),
+        'office_export': (export(prepare_office, OFFICE_OUTPUT), ['office_episodes']),
+    }
+
+
+# Report outputs, each standing in for one of the standalone scripts
+OUTPUTS = {
+    'examine': ['netflix_summary', 'office_summary'],
+    'netflix_panels': ['yearly_duration', 'short_genres'],
+    'office_panels': ['season_stats', 'guest_impact', 'top_episodes'],
+    'bi_exports': ['netflix_export', 'office_export'],
+}
+
+
+# =============================================================================
+# PLANNING AND EXECUTION
+# =============================================================================
+
+def plan(targets, stages):
+    """All stages needed for `targets`, each once, dependencies first."""
+    ordered, seen = [], set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dependency in stages[name][1]:
+            visit(dependency)
+        ordered.append(name)
+
+    for target in targets:
+        visit(target)
+    return ordered
+
+
+def execute(stage_names, stages, max_workers=4):
+    """
+    Run the planned stages in a thread pool, starting each one as soon as
+    its dependencies have finished. Returns (results, seconds per stage).
+    """
+    results, durations = {}, {}
+    remaining = list(stage_names)
+    running = {}
+
+    def run(name):
+        started = time.perf_counter()
+        function, dependencies = stages[name]
+        value = function(*[results[dependency] for dependency in dependencies])
+        return value, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while remaining or running:
+            for name in [n for n in remaining if all(d in results for d in stages[n][1])]:
+                remaining.remove(name)
+                running[executor.submit(run, name)] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name], durations[name] = future.result()
+
+    return results, durations
+
+
+def run_report(outputs=None, data_dir='../data', max_workers=4):
+    """
+    Build one deduplicated plan for the requested outputs, run it and
+    compare with running each output's pipeline separately.
+    """
+    outputs = outputs or list(OUTPUTS)
+    stages = build_stages(data_dir)
+    shared_plan = plan([stage for output in outputs for stage in OUTPUTS[output]], stages)
+
+    started = time.perf_counter()
+    results, durations = execute(shared_plan, stages, max_workers)
+    wall_time = time.perf_counter() - started
+
+    # Separate runs repeat every stage of each output's own plan
+    separate_plans = [plan(OUTPUTS[output], stages) for output in outputs]
+    separate_stages = [name for stage_plan in separate_plans for name in stage_plan]
+    savings = {
+        'stages_separate': len(separate_stages),
+        'stages_shared': len(shared_plan),
+        'csv_reads_separate': sum(name.endswith('_raw') for name in separate_stages),
+        'csv_reads_shared': sum(name.endswith('_raw') for name in shared_plan),
+        'seconds_separate': sum(durations[name] for name in separate_stages),
+        'seconds_shared': sum(durations.values()),
+        'wall_time': wall_time,
+    }
+    return {output: {stage: results[stage] for stage in OUTPUTS[output]} for output in outputs}, savings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the Netflix & Office report from one shared plan')
+    parser.add_argument('outputs', nargs='*', metavar='OUTPUT',
+                        help=f"any of {', '.join(sorted(OUTPUTS))} (default: all)")
+    parser.add_argument('--data-dir', default='../data')
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    unknown = [output for output in args.outputs if output not in OUTPUTS]
+    if unknown:
+        parser.error(f"unknown output(s): {', '.join(unknown)}")
+
+    print("🧩 NETFLIX & OFFICE REPORT RUNNER")
+    print("=" * 55)
+    report, savings = run_report(args.outputs, args.data_dir, args.workers)
+
+    if 'examine' in report:
+        netflix, office = report['examine']['netflix_summary'], report['examine']['office_summary']
+        print(f"\n📽️ Netflix: {netflix['shape'][0]:,} titles, {netflix['year_range'][0]}-{netflix['year_range'][1]}")
+        print(f"🏢 The Office: {office['shape'][0]} episodes, {office['guest_episodes']} with guest stars")
+
+    if 'netflix_panels' in report:
+        yearly = report['netflix_panels']['yearly_duration']
+        print(f"\n🎬 Average movie duration: {yearly['mean'].iloc[0]:.1f} min ({yearly.index[0]}) "
+              f"-> {yearly['mean'].iloc[-1]:.1f} min ({yearly.index[-1]})")
+        top_short = report['netflix_panels']['short_genres']
+        print(f"  Most common short-movie genre: {top_short.index[0]} ({top_short.iloc[0]})")
+
+    if 'office_panels' in report:
+        best = report['office_panels']['top_episodes'].iloc[0]
+        print(f"\n🏆 Most watched episode: '{best['EpisodeTitle']}' ({best['Viewership']:.1f}M viewers)")
+        guests = report['office_panels']['guest_impact']
+        print(f"  Avg viewership with / without guests: "
+              f"{guests.loc[True, 'Viewership']:.2f}M / {guests.loc[False, 'Viewership']:.2f}M")
+
+    if 'bi_exports' in report:
+        exports = report['bi_exports']
+        print(f"\n📊 BI exports: {exports['netflix_export']} movies, {exports['office_export']} episodes")
+
+    print(f"\n⚡ Work saved vs. running the scripts separately:")
+    print(f"  Stages run: {savings['stages_shared']} instead of {savings['stages_separate']}")
+    print(f"  CSV reads: {savings['csv_reads_shared']} instead of {savings['csv_reads_separate']}")
+    print(f"  Stage time: {savings['seconds_shared']:.2f}s instead of {savings['seconds_separate']:.2f}s "
+          f"(wall time {savings['wall_time']:.2f}s with {args.workers} workers)")
+    print("=" * 55)
@@ -0,0 +1,314 @@
+# sketches.py
+import base64
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_validation import NETFLIX_RULES, validate
+
+# =============================================================================
+# HYPERLOGLOG - approximate distinct counts
+#
+# Error bound: relative standard error 1.04 / sqrt(2**p). With the default
+# p=12 (4096 one-byte registers, 4 KB per group) that is 1.6%, so 99.7% of
+# estimates fall within +/-4.9% of the true count. Below 2.5 * 2**p distinct
+# values linear counting is used and small counts are almost exact.
+# =============================================================================
+
+def hash_values(values):
+    """Deterministic 64-bit hashes (same in every process, unlike hash())."""
+    return pd.util.hash_array(np.asarray(values, dtype=object))
+
+
+class HyperLogLog:
+    def __init__(self, p=12, registers=None):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8) if registers is None else registers
+
+    @staticmethod
+    def register_updates(hashes, p):
+        """Register index and rank (position of the first 1-bit) for each hash."""
+        index = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # rest < 2**52 is exact in float64, so frexp gives its bit length
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        rank = (64 - p) - bit_length + 1
+        return index, rank.astype(np.uint8)
+
+    def update(self, values):
+        index, rank = self.register_updates(hash_values(values), self.p)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different p")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m ** 2 / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * self.m and zeros > 0:
+            estimate = self.m * np.log(self.m / zeros)
+        return float(estimate)
+
+    def to_dict(self):
+        return {'p': self.p, 'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+
+    @classmethod
+    def from_dict(cls, data):
+        registers = np.frombuffer(base64.b64decode(data['registers']), dtype=np.uint8).copy()
+        return cls(p=data['p'], registers=registers)
+
+
+# =============================================================================
+# KLL - approximate quantiles
+#
+# Error bound: rank error, i.e. |fraction of values <= estimate - q|. With
+# the default k=200 the normalized rank error is about 1.65% with 99%
+# confidence (Karnin, Lang & Liberty 2016; Apache DataSketches tables),
+# storing at most about 3k values per group however many rows are added.
+# =============================================================================
+
+class KLLSketch:
+    def __init__(self, k=200, seed=None):
+        # seed: int or list of ints; it is serialized so restored sketches compact reproducibly
+        self.k = k
+        self.n = 0
+        self.compactors = [np.empty(0)]
+        self.seed = seed
+        self.rng = np.random.RandomState(seed)
+
+    def _capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.compactors):
+            items = self.compactors[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind; every other remaining item is promoted
+                keep = items[:len(items) % 2]
+                promoted = items[len(items) % 2:][self.rng.randint(2)::2]
+                self.compactors[level] = keep
+                self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+                level = 0  # capacities shift when a level is added
+            else:
+                level += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self.n += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Approximate q-quantile (q in [0, 1], or an array of them)."""
+        if self.n == 0:
+            return np.nan
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(c), 2.0 ** level) for level, c in enumerate(self.compactors)])
+        order = np.argsort(items, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1], side='left')
+        return items[order][np.minimum(positions, len(items) - 1)]
+
+    def to_dict(self):
+        return {'k': self.k, 'n': self.n, 'seed': self.seed, 'compactors': [c.tolist() for c in self.compactors]}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(k=data['k'], seed=data.get('seed'))
+        sketch.n = data['n']
+        sketch.compactors = [np.asarray(c, dtype=float) for c in data['compactors']]
+        return sketch
+
+
+# =============================================================================
+# GROUPED SKETCHES OVER THE NETFLIX CATALOG
+# =============================================================================
+
+def clean_netflix_chunk(chunk):
+    """
+    Validated rows of a raw chunk with numeric movie durations. show_id
+    uniqueness is not checked (a per-chunk check would miss most duplicates).
+    """
+    chunk, _, _ = validate(chunk, NETFLIX_RULES)
+    chunk = chunk.copy()
+    is_movie = chunk['type'] == 'Movie'
+    chunk['duration_min'] = np.where(
+        is_movie, chunk['duration'].str.extract(r'(\d+)', expand=False).astype(float), np.nan)
+    chunk['decade'] = (chunk['release_year'] // 10) * 10
+    return chunk
+
+
+def sketch_chunk(chunk, p=12, k=200, seed=None):
+    """
+    One streaming pass over a cleaned chunk:
+      - distinct cast members per release year (HyperLogLog)
+      - movie duration per (genre, decade) (KLL)
+    Returns {'cast': {year: HLL}, 'duration': {(genre, decade): KLL}}.
+    `seed` (a list of ints, e.g. [seed, chunk index]) makes the KLL
+    compactions reproducible; each group extends it with its position.
+    """
+    cast = chunk[['release_year', 'cast']].dropna()
+    cast = cast.assign(cast=cast['cast'].str.split(', ')).explode('cast')
+    cast_sketches = {}
+    if len(cast) > 0:
+        # One np.maximum.at for all years: flat index = year code * m + register
+        years, year_codes = np.unique(cast['release_year'].to_numpy(), return_inverse=True)
+        index, rank = HyperLogLog.register_updates(hash_values(cast['cast'].str.strip()), p)
+        registers = np.zeros(len(years) << p, dtype=np.uint8)
+        np.maximum.at(registers, (year_codes.astype(np.int64) << p) + index, rank)
+        for i, year in enumerate(years):
+            cast_sketches[int(year)] = HyperLogLog(p, registers[i << p:(i + 1) << p].copy())
+
+    movies = chunk.loc[chunk['duration_min'].notna(), ['listed_in', 'decade', 'duration_min']]
+    movies = movies.assign(genre=movies['listed_in'].str.split(', ')).explode('genre')
+    duration_sketches = {}
+    for g, ((genre, decade), group) in enumerate(movies.groupby(['genre', 'decade'])):
+        group_seed = None if seed is None else [*seed, g]
+        duration_sketches[(genre, int(decade))] = KLLSketch(k, group_seed).update(group['duration_min'].to_numpy())
+
+    return {'cast': cast_sketches, 'duration': duration_sketches}
+
+
+def merge_sketch_maps(left, right):
+    """Merge two sketch_chunk results group by group (left is updated)."""
+    for family in ['cast', 'duration']:
+        for key, sketch in right[family].items():
+            if key in left[family]:
+                left[family][key].merge(sketch)
+            else:
+                left[family][key] = sketch
+    return left
+
+
+def sketch_maps_to_json(sketches):
+    return json.dumps({
+        'cast': {str(year): s.to_dict() for year, s in sketches['cast'].items()},
+        'duration': [[genre, decade, s.to_dict()] for (genre, decade), s in sketches['duration'].items()],
+    })
+
+
+def sketch_maps_from_json(text):
+    data = json.loads(text)
+    return {
+        'cast': {int(year): HyperLogLog.from_dict(s) for year, s in data['cast'].items()},
+        'duration': {(genre, decade): KLLSketch.from_dict(s) for genre, decade, s in data['duration']},
+    }
+
+
+def _sketch_chunk_json(chunk, seed):
+    # Worker entry point: sketches cross the process boundary serialized
+    return sketch_maps_to_json(sketch_chunk(clean_netflix_chunk(chunk), seed=seed))
+
+
+def build_sketches(path='../data/netflix_data.csv', chunksize=100_000, max_workers=None, seed=42):
+    """
+    Stream the CSV in chunks, sketch each chunk in a worker process and
+    merge in chunk order. At most 2 chunks per worker are in flight, so
+    memory does not grow with the file. Chunk i is sketched with seed
+    (seed, i), so results depend only on the seed and chunk size.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    merged = {'cast': {}, 'duration': {}}
+
+    def merge(future):
+        merge_sketch_maps(merged, sketch_maps_from_json(future.result()))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for i, chunk in enumerate(pd.read_csv(path, chunksize=chunksize)):
+            pending.append(executor.submit(_sketch_chunk_json, chunk, [seed, i]))
+            if len(pending) >= 2 * workers:
+                merge(pending.popleft())
+        while pending:
+            merge(pending.popleft())
+    return merged
+
+
+# =============================================================================
+# ACCURACY CHECK AGAINST EXACT RESULTS
+# =============================================================================
+
+def verify_against_exact(sketches, netflix_df, quantiles=(0.5, 0.9), min_group_size=20):
+    """Compare sketch answers with exact groupby results. Returns two DataFrames."""
+    clean = clean_netflix_chunk(netflix_df)
+
+    cast = clean[['release_year', 'cast']].dropna()
+    cast = cast.assign(cast=cast['cast'].str.split(', ')).explode('cast')
+    exact_distinct = cast.assign(cast=cast['cast'].str.strip()).groupby('release_year')['cast'].nunique()
+    distinct = pd.DataFrame({
+        'exact': exact_distinct,
+        'estimate': [sketches['cast'][int(year)].count() for year in exact_distinct.index],
+    })
+    distinct['relative_error'] = (distinct['estimate'] - distinct['exact']).abs() / distinct['exact']
+
+    movies = clean.loc[clean['duration_min'].notna(), ['listed_in', 'decade', 'duration_min']]
+    movies = movies.assign(genre=movies['listed_in'].str.split(', ')).explode('genre')
+    rows = []
+    for (genre, decade), group in movies.groupby(['genre', 'decade']):
+        if len(group) < min_group_size:
+            continue
+        values = np.sort(group['duration_min'].to_numpy())
+        estimates = sketches['duration'][(genre, int(decade))].quantile(list(quantiles))
+        for q, estimate in zip(quantiles, estimates):
+            # Rank error: how far the estimate's rank is from q (ties count as a match)
+            low = np.searchsorted(values, estimate, side='left') / len(values)
+            high = np.searchsorted(values, estimate, side='right') / len(values)
+            rows.append({'genre': genre, 'decade': decade, 'q': q, 'count': len(values),
+                         'exact': np.quantile(values, q), 'estimate': estimate,
+                         'rank_error': max(0.0, low - q, q - high)})
+    return distinct, pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    print("📐 NETFLIX SKETCHES - DISTINCT COUNTS & QUANTILES")
+    print("=" * 55)
+
+    # Small chunks so the bundled file exercises chunk and process merging
+    sketches = build_sketches(chunksize=1000)
+    print(f"✓ {len(sketches['cast'])} year HyperLogLogs, {len(sketches['duration'])} genre/decade KLL sketches")
+
+    restored = sketch_maps_from_json(sketch_maps_to_json(sketches))
+    print(f"✓ Serialized round trip: {len(sketch_maps_to_json(restored)):,} bytes of JSON")
+
+    distinct, quantile_errors = verify_against_exact(restored, pd.read_csv('../data/netflix_data.csv'))
+
+    print(f"\n👥 Distinct cast members per year (HyperLogLog, p=12, bound ±4.9%):")
+    for year, row in distinct.tail(5).iterrows():
+        print(f"  {year}: exact {row['exact']:,.0f} | estimate {row['estimate']:,.0f} ({row['relative_error']:.2%})")
+    print(f"  Max relative error over {len(distinct)} years: {distinct['relative_error'].max():.2%}")
+
+    print(f"\n⏱️ Movie duration quantiles per genre/decade (KLL, k=200, bound 1.65% rank error):")
+    for _, row in quantile_errors.nlargest(5, 'count').iterrows():
+        print(f"  {row['genre'][:25]:25s} {row['decade']}s p{row['q'] * 100:.0f}: "
+              f"exact {row['exact']:.0f} | estimate {row['estimate']:.0f} min")
+    print(f"  Max rank error over {len(quantile_errors)} estimates: {quantile_errors['rank_error'].max():.2%}")
+
+    within_bounds = distinct['relative_error'].max() <= 0.049 and quantile_errors['rank_error'].max() <= 0.0165
+    print(f"\n{'✅' if within_bounds else '❌'} Sketch errors {'within' if within_bounds else 'OUTSIDE'} documented bounds")
+    print("=" * 55)
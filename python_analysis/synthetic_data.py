@@ -0,0 +1,307 @@
+# synthetic_data.py
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_validation import NETFLIX_RULES, OFFICE_RULES, validate
+
+NETFLIX_COLUMNS = ['show_id', 'type', 'title', 'director', 'cast', 'country', 'date_added',
+                   'release_year', 'rating', 'duration', 'listed_in', 'description']
+OFFICE_COLUMNS = ['', 'Season', 'EpisodeTitle', 'About', 'Ratings', 'Votes', 'Viewership',
+                  'Duration', 'Date', 'GuestStars', 'Director', 'Writers']
+
+# Columns sampled per content type, so e.g. "N Seasons" only appears on TV shows
+NETFLIX_TYPED_COLUMNS = ['title', 'director', 'country', 'date_added', 'release_year',
+                         'rating', 'duration', 'listed_in', 'description']
+
+# Cast strings are rebuilt from first/last names in every chunk, so the
+# number of distinct cast members keeps growing with the row count
+CAST_POOL_SIZE = 16384
+
+
+# =============================================================================
+# PROFILES - empirical marginals taken from the (validated) bundled datasets
+# =============================================================================
+
+def build_netflix_profile(netflix_df):
+    netflix_df, _, _ = validate(netflix_df, NETFLIX_RULES)
+    # Rows are grouped by type, so each type samples from its own slice of the pools
+    netflix_df = netflix_df.sort_values('type', kind='stable')
+    type_names, type_starts, type_counts = np.unique(
+        netflix_df['type'].to_numpy(dtype=object), return_index=True, return_counts=True)
+    profile = {
+        'type_names': type_names,
+        'type_probabilities': type_counts / type_counts.sum(),
+        'type_starts': type_starts,
+        'type_counts': type_counts,
+        'pools': {column: netflix_df[column].to_numpy() if column == 'release_year'
+                  else netflix_df[column].to_numpy(dtype=object)
+                  for column in NETFLIX_TYPED_COLUMNS},
+        'cast_size': netflix_df['cast'].str.split(', ').str.len().fillna(0).astype(int).to_numpy(),
+    }
+
+    names = netflix_df['cast'].dropna().str.split(', ').explode().str.strip()
+    first_last = names.str.split(' ', n=1, expand=True).dropna()
+    profile['first_names'] = first_last[0].to_numpy(dtype=object)
+    profile['last_names'] = first_last[1].to_numpy(dtype=object)
+    return profile
+
+
+def build_office_profile(office_df):
+    office_df, _, _ = validate(office_df, OFFICE_RULES)
+    profile = {column: office_df[column].to_numpy() if office_df[column].dtype.kind in 'if'
+               else office_df[column].to_numpy(dtype=object)
+               for column in OFFICE_COLUMNS[1:]}
+    profile['guest_rate'] = office_df['GuestStars'].notna().mean()
+    # Index 0 is the empty value, guests are 1..len
+    profile['GuestStars'] = np.concatenate([[np.nan], office_df['GuestStars'].dropna().to_numpy(dtype=object)])
+    return profile
+
+
+def load_profiles(data_dir='../data'):
+    return {
+        'netflix': build_netflix_profile(pd.read_csv(os.path.join(data_dir, 'netflix_data.csv'))),
+        'office': build_office_profile(pd.read_csv(os.path.join(data_dir, 'office_data.csv'))),
+    }
+
+
+# =============================================================================
+# CHUNK GENERATORS
+# A chunk is {column: (pool, index)}: every row's value is pool[index[row]].
+# Pools are small (the profile values) except for per-row ids, so CSV
+# encoding happens once per pool value rather than once per cell.
+# =============================================================================
+
+def _sample_index(pool_size, n, rng):
+    return rng.integers(0, pool_size, n)
+
+
+def _row_ids(prefix, start, n):
+    """Per-row id pool as a fixed-width bytes array, built without Python loops."""
+    numbers = np.arange(start, start + n).astype('S')
+    return np.char.add(prefix, numbers) if prefix else numbers, np.arange(n)
+
+
+def _cast_pool(profile, sizes, rng):
+    """One comma-joined cast string per entry of `sizes` (NaN for 0)."""
+    total = int(sizes.sum())
+    first = profile['first_names'][_sample_index(len(profile['first_names']), total, rng)]
+    last = profile['last_names'][_sample_index(len(profile['last_names']), total, rng)]
+    names = first + ' ' + last
+    ends = np.cumsum(sizes)
+    return np.array([', '.join(names[e - s:e]) if s else np.nan for s, e in zip(sizes, ends)],
+                    dtype=object)
+
+
+def _typed_draw(profile, type_codes, rng):
+    """Random profile row for each generated row, drawn within its type's slice."""
+    return (profile['type_starts'][type_codes]
+            + (rng.random(len(type_codes)) * profile['type_counts'][type_codes]).astype(np.int64))
+
+
+def generate_netflix_chunk(n, profile, rng, start_id=0):
+    type_codes = rng.choice(len(profile['type_names']), n, p=profile['type_probabilities'])
+    chunk = {'show_id': _row_ids(b's', start_id + 1, n), 'type': (profile['type_names'], type_codes)}
+
+    # A separate draw per column keeps the columns independent within a type
+    for column in NETFLIX_TYPED_COLUMNS:
+        chunk[column] = (profile['pools'][column], _typed_draw(profile, type_codes, rng))
+
+    # Cast lists come from a fresh per-chunk pool; entry i is sized like a cast
+    # of type type_codes[i], and rows only pick entries built for their type
+    pool_types = type_codes[:min(n, CAST_POOL_SIZE)]
+    cast_pool = _cast_pool(profile, profile['cast_size'][_typed_draw(profile, pool_types, rng)], rng)
+    cast_index = np.zeros(n, dtype=np.int64)
+    for code in range(len(profile['type_names'])):
+        candidates = np.flatnonzero(pool_types == code)
+        rows = np.flatnonzero(type_codes == code)
+        if len(candidates):
+            cast_index[rows] = candidates[_sample_index(len(candidates), len(rows), rng)]
+    chunk['cast'] = (cast_pool, cast_index)
+
+    return {column: chunk[column] for column in NETFLIX_COLUMNS}
+
+
+def generate_office_chunk(n, profile, rng, start_id=0):
+    chunk = {'': _row_ids(b'', start_id, n)}
+    for column in OFFICE_COLUMNS[1:]:
+        if column == 'GuestStars':
+            pool = profile['GuestStars']
+            has_guest = rng.random(n) < profile['guest_rate']
+            index = np.where(has_guest, 1 + _sample_index(len(pool) - 1, n, rng), 0)
+        else:
+            pool = profile[column]
+            index = _sample_index(len(pool), n, rng)
+        chunk[column] = (pool, index)
+    return chunk
+
+
+GENERATORS = {
+    'netflix': generate_netflix_chunk,
+    'office': generate_office_chunk,
+}
+
+
+def chunk_to_frame(chunk):
+    """Materialize a generated chunk as a DataFrame."""
+    frame = {}
+    for column, (pool, index) in chunk.items():
+        values = pool[index]
+        frame[column] = values.astype(str) if values.dtype.kind == 'S' else values
+    return pd.DataFrame(frame)
+
+
+# =============================================================================
+# CSV ENCODING
+# =============================================================================
+
+def _csv_field(value):
+    """Encode one value the way DataFrame.to_csv does (QUOTE_MINIMAL)."""
+    if isinstance(value, float) and np.isnan(value):
+        return b''
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        text = '"' + text.replace('"', '""') + '"'
+    return text.encode('utf-8')
+
+
+def _encode_pool(pool, separator=b''):
+    """Pool values as an object array of CSV-encoded bytes, each followed by `separator`."""
+    if pool.dtype.kind == 'S':
+        # Fixed-width ids are plain ASCII digits and never need quoting
+        return np.array(np.char.add(pool, separator).tolist(), dtype=object)
+    return np.array([_csv_field(value) + separator for value in pool], dtype=object)
+
+
+def encode_profile_pools(profile):
+    """Encode every value pool of a profile once, for reuse across chunks."""
+    pools = [value for value in profile.values() if isinstance(value, np.ndarray)]
+    pools += list(profile.get('pools', {}).values())
+    # The cache holds each pool next to its encoding, so the id cannot be reused
+    return {id(pool): (pool, _encode_pool(pool)) for pool in pools}
+
+
+def encode_csv_rows(chunk, cache=None):
+    """
+    CSV bytes for a chunk. Pools are encoded once (or taken from `cache`,
+    see encode_profile_pools), the separator is appended per pool value,
+    and each cell is then just a reference into its pool, so a whole chunk
+    is assembled with a single bytes.join.
+    """
+    columns = list(chunk.values())
+    n = len(columns[0][1])
+    cells = np.empty((n, len(columns)), dtype=object)
+    for i, (pool, index) in enumerate(columns):
+        separator = b'\n' if i == len(columns) - 1 else b','
+        if cache is not None and id(pool) in cache:
+            encoded = cache[id(pool)][1] + separator
+        else:
+            encoded = _encode_pool(pool, separator)
+        cells[:, i] = encoded[index]
+    return b''.join(cells.ravel().tolist())
+
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+# Per-process generator state, set once by _init_chunk_state
+_chunk_state = {}
+
+
+def _init_chunk_state(kind, profile):
+    _chunk_state.update(generate=GENERATORS[kind], profile=profile, cache=encode_profile_pools(profile))
+
+
+def _csv_chunk(seed, i, start, n):
+    chunk = _chunk_state['generate'](n, _chunk_state['profile'], np.random.default_rng([seed, i]), start_id=start)
+    return encode_csv_rows(chunk, _chunk_state['cache'])
+
+
+def write_dataset(kind, n_rows, path, seed=42, chunk_size=100_000, fmt='csv', profiles=None, workers=1):
+    """
+    Write `n_rows` synthetic rows in the schema of `kind` ('netflix' or
+    'office') chunk by chunk, so memory stays bounded by `chunk_size`.
+    Chunk i is drawn from its own generator seeded with (seed, i), so the
+    output depends only on the seed and chunk size - including when CSV
+    chunks are generated by `workers` processes (at most 2 per worker are
+    in flight). Returns bytes written.
+    """
+    profile = (profiles or load_profiles())[kind]
+    header = ','.join(NETFLIX_COLUMNS if kind == 'netflix' else OFFICE_COLUMNS) + '\n'
+
+    if fmt == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow")
+    elif fmt != 'csv':
+        raise ValueError(f"Unknown format '{fmt}' (expected 'csv' or 'parquet')")
+    if n_rows < 1 or chunk_size < 1:
+        raise ValueError("n_rows and chunk_size must be at least 1")
+
+    if fmt == 'csv':
+        tasks = [(seed, i, start, min(chunk_size, n_rows - start))
+                 for i, start in enumerate(range(0, n_rows, chunk_size))]
+        with open(path, 'wb') as f:
+            f.write(header.encode('utf-8'))
+            if workers <= 1:
+                _init_chunk_state(kind, profile)
+                for task in tasks:
+                    f.write(_csv_chunk(*task))
+            else:
+                with ProcessPoolExecutor(workers, initializer=_init_chunk_state,
+                                         initargs=(kind, profile)) as executor:
+                    pending = deque()
+                    for task in tasks:
+                        pending.append(executor.submit(_csv_chunk, *task))
+                        if len(pending) >= 2 * workers:
+                            f.write(pending.popleft().result())
+                    while pending:
+                        f.write(pending.popleft().result())
+    else:
+        parquet_writer = None
+        try:
+            for i, start in enumerate(range(0, n_rows, chunk_size)):
+                chunk = GENERATORS[kind](min(chunk_size, n_rows - start), profile,
+                                 np.random.default_rng([seed, i]), start_id=start)
+                table = pa.Table.from_pandas(chunk_to_frame(chunk), preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(path, table.schema)
+                parquet_writer.write_table(table)
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+
+    return os.path.getsize(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate synthetic Netflix / Office datasets')
+    parser.add_argument('kind', choices=sorted(GENERATORS))
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    if args.rows < 1 or args.chunk_size < 1:
+        parser.error("--rows and --chunk-size must be at least 1")
+
+    output = args.output or f'../data/synthetic_{args.kind}_data.{args.format}'
+
+    print("🧪 SYNTHETIC DATA GENERATOR")
+    print("=" * 50)
+    started = time.perf_counter()
+    size = write_dataset(args.kind, args.rows, output, args.seed, args.chunk_size, args.format,
+                         workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"✓ {args.rows:,} {args.kind} rows written to {output}")
+    print(f"  {size / 1e6:,.1f} MB in {elapsed:.1f}s ({size / 1e6 / elapsed:,.0f} MB/s)")